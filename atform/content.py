@@ -1,7 +1,10 @@
 """Objects to store test procedure content."""
 
 
+import concurrent.futures
+import multiprocessing
 import os
+import sys
 
 from . import error
 from . import id as id_
@@ -21,23 +24,117 @@ def build_path(tid, root, depth):
     section number limited to depth, e.g., <root>/<x>/<y> for an ID x.y.z
     and depth 2. The final number in an ID is not translated to a folder.
     """
-    folders = [root]
+    # Tests are placed directly in the root if no section folders are used.
+    if not depth:
+        return root
 
-    # Append a folder for each section level.
-    for i, section_id in enumerate(tid[:depth]):
+    return os.path.join(root, section_path(tid[:depth]))
 
-        # Include the section number and title if the section has a title.
+
+def section_path(sid):
+    """Determines the relative folder path for a section.
+
+    Paths are cached because all tests within a section share the same
+    folders.
+    """
+    path = state.section_paths.get(sid)
+    if path is None:
+        folder = section_folder(sid)
+
+        # Subsections extend the path of their parent section, which is
+        # itself cached, so each section level is only evaluated once.
+        if len(sid) > 1:
+            path = os.path.join(section_path(sid[:-1]), folder)
+        else:
+            path = folder
+
+        state.section_paths[sid] = path
+
+    return path
+
+
+def section_folder(sid):
+    """Determines the folder name for a single section level."""
+    title = state.section_titles.get(sid)
+
+    # Use only the section number if the section has no title.
+    if title is None:
+        return str(sid[-1])
+
+    # Include the section number and title if the section has a title.
+    return f"{sid[-1]} {title}"
+
+
+def get_version():
+    """Determines the document version from version control.
+
+    Version control is only queried for the first call because queries
+    execute external processes. Reusing the initial result also keeps the
+    version consistent if generate() is called again after output
+    written by the first call altered the working directory.
+    """
+    if not state.version_queried:
         try:
-            section = state.section_titles[tid[: i + 1]]
-            section_folder = f"{section_id} {section}"
+            git = vcs.Git()
+        except vcs.NoVersionControlError:
+            state.version = None
+        else:
+            state.version = git.version if git.clean else "draft"
+        state.version_queried = True
 
-        # Use only the section number if the section has no title.
-        except KeyError:
-            section_folder = str(section_id)
+    return state.version
 
-        folders.append(section_folder)
 
-    return os.path.join(*folders)
+def restore_test(attrs):
+    """Recreates a pickled Test instance without calling __init__()."""
+    # The Test name in this module refers to the wrapper created by
+    # @exit_on_script_error, so the class itself is acquired via the
+    # __wrapped__ attribute added by functools.wraps().
+    test = object.__new__(Test.__wrapped__)
+    test.__dict__.update(attrs)
+    return test
+
+
+def get_build_context():
+    """Selects the multiprocessing context for PDF build worker processes.
+
+    Only the fork start method is used because workers then inherit all
+    global data from the main process. Other start methods launch each
+    worker with a fresh interpreter, which executes the user script
+    again; None is returned if fork is unavailable or unsafe so PDFs are
+    instead built within the main process.
+    """
+    # Forked processes on macOS may crash if system libraries have
+    # already started threads in the parent process.
+    if sys.platform == "darwin":
+        return None
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def build_pdf(args):
+    """Creates the output PDF for a single test."""
+    test, path = args
+    pdf.TestDocument(test, path, state.version)
+
+
+def build_parallel(jobs, workers, context):
+    """Builds output PDFs with a pool of worker processes."""
+    # Distribute jobs in chunks to reduce interprocess communication
+    # overhead while leaving enough chunks to balance the load among
+    # workers.
+    chunksize = max(1, len(jobs) // (workers * 4))
+
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+    ) as executor:
+        # Consume all results to propagate any exceptions raised by
+        # the workers.
+        for _ in executor.map(build_pdf, jobs, chunksize=chunksize):
+            pass
 
 
 ################################################################################
@@ -120,10 +217,11 @@ class Test:
         except error.UserScriptError as e:
             self._add_exception_context(e)
 
-        # The current project information is captured using copy() because
-        # the project information dictionary may change for later tests;
-        # copy() ensures this instance's values are unaffected.
-        self.project_info = state.project_info.copy()
+        # The current project information dictionary can be shared without
+        # copying because set_project_info() replaces it rather than
+        # modifying it, leaving this instance's values unaffected by
+        # changes made for later tests.
+        self.project_info = state.project_info
 
         state.tests.append(self)
 
@@ -150,8 +248,8 @@ class Test:
                 "References must be a dictionary.",
             )
 
-        return dict([self._validate_ref_category(label, refs[label])
-                     for label in refs])
+        return dict(self._validate_ref_category(label, cat_refs)
+                    for label, cat_refs in refs.items())
 
     @staticmethod
     def _validate_ref_category(label, refs):
@@ -159,17 +257,18 @@ class Test:
         label = misc.nonempty_string("Reference label", label)
 
         # Ensure the label has been defined by add_reference_category().
-        try:
-            state.ref_titles[label]
-        except KeyError as e:
+        if label not in state.ref_titles:
             raise error.UserScriptError(
                 f"Invalid reference label: {label}",
                 """Use a reference label that has been previously defined
                 with atform.add_reference_category.""",
-            ) from e
+            )
 
-        # Check the list of references for this category.
+        # Check the list of references for this category. References are
+        # also tracked in a set for efficient duplicate detection while the
+        # list preserves their original order.
         validated_refs = []
+        seen = set()
 
         if not isinstance(refs, list):
             raise TypeError(
@@ -192,7 +291,7 @@ class Test:
                 reference = reference.strip()
 
                 # Reject duplicate references.
-                if reference in validated_refs:
+                if reference in seen:
                     raise error.UserScriptError(
                         f"Duplicate reference: {reference}",
                         """Ensure all references within a category are
@@ -205,6 +304,7 @@ class Test:
 
             # Ignore blank/empty references.
             if reference:
+                seen.add(reference)
                 validated_refs.append(reference)
 
 
@@ -224,14 +324,27 @@ class Test:
             raise error.UserScriptError(
                 f"{name} must be a list of strings.",
             )
-        items = []
-        for i, s in enumerate(lst, start=1):
+
+        # Validate all items at once without per-item exception handling,
+        # which is only needed to report an invalid item. Items are interned
+        # the same as strings validated by misc.nonempty_string().
+        stripped = [misc.intern_short(s.strip())
+                    for s in lst if isinstance(s, str)]
+        if (len(stripped) != len(lst)) or not all(stripped):
+
+            # Locate the first invalid item, and validate it individually
+            # to raise an error identifying it.
+            i, s = next(
+                (i, s) for i, s in enumerate(lst, start=1)
+                if not (isinstance(s, str) and s.strip())
+            )
             try:
-                items.append(misc.nonempty_string(f"{name} list item", s))
+                misc.nonempty_string(f"{name} list item", s)
             except error.UserScriptError as e:
                 e.add_field(f"{name} item #", i)
                 raise
-        return items
+
+        return stripped
 
     @error.external_call
     def pregenerate(self):
@@ -253,19 +366,32 @@ class Test:
                 e.add_field("Test Section", "Objective")
                 raise
 
-        for i, item in enumerate(self.preconditions):
-            try:
-                self.preconditions[i] = label_.resolve(item)
-            except error.UserScriptError as e:
-                e.add_field("Precondition Item", i+1)
-                raise
+        self.preconditions = label_.resolve_many(
+            self.preconditions,
+            "Precondition Item",
+        )
 
-        for i, step in enumerate(self.procedure, start=1):
-            try:
-                step.resolve_labels()
-            except error.UserScriptError as e:
-                e.add_field("Procedure Step", i)
-                raise
+        texts = label_.resolve_many(
+            [step.text for step in self.procedure],
+            "Procedure Step",
+        )
+        for step, text in zip(self.procedure, texts):
+            step.text = text
+
+    def __reduce__(self):
+        """Pickling support for transferring tests to PDF build processes.
+
+        A custom reduction is necessary because pickle cannot locate this
+        class by name; see restore_test().
+        """
+        attrs = self.__dict__.copy()
+
+        # The call frame is only used to report errors in the content
+        # provided to this instance, all of which have been validated
+        # before any PDFs are built.
+        attrs.pop("_call_frame", None)
+
+        return (restore_test, (attrs,))
 
     def _add_exception_context(self, e):
         """Adds information identifying this test to a UserScriptError."""
@@ -308,9 +434,6 @@ def generate(path="pdf", folder_depth=0):
             "Output path must be a string.",
         )
 
-    for t in state.tests:
-        t.pregenerate()
-
     if not isinstance(folder_depth, int):
         raise error.UserScriptError(
             "Folder depth must be an integer.",
@@ -333,13 +456,37 @@ def generate(path="pdf", folder_depth=0):
             remedy,
         )
 
-    try:
-        git = vcs.Git()
-    except vcs.NoVersionControlError:
-        version = None
-    else:
-        version = git.version if git.clean else "draft"
-
+    # Tests are only processed after all arguments have been validated
+    # to avoid needless work if an argument is invalid.
     for t in state.tests:
-        test_path = build_path(t.id, path, folder_depth)
-        pdf.TestDocument(t, test_path, version)
+        t.pregenerate()
+
+    # Query the version before building any PDFs; it is used by all of
+    # them via the state module, which is inherited by worker processes.
+    get_version()
+
+    jobs = [(t, build_path(t.id, path, folder_depth)) for t in state.tests]
+
+    # Create output folders before building any PDFs; many tests share the
+    # same folder, so each distinct folder is created only once.
+    for folder in {test_path for _, test_path in jobs}:
+        os.makedirs(folder, exist_ok=True)
+
+    context = get_build_context()
+
+    # Workers in excess of the number of jobs would have nothing to do.
+    workers = min(os.cpu_count() or 1, len(jobs))
+
+    # Build within this process when debugging so any exception raised
+    # while building a PDF yields a normal traceback. PDFs are also built
+    # here if worker processes cannot be forked, or if there would only be
+    # one worker, i.e., a single PDF or CPU, because a one-worker pool only
+    # adds the cost of starting a process and transferring every test to it.
+    if error.DEBUG or (workers < 2) or (context is None):
+        for job in jobs:
+            build_pdf(job)
+
+    # Each PDF is independent of all others, so they are otherwise built
+    # in parallel.
+    else:
+        build_parallel(jobs, workers, context)
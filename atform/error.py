@@ -9,11 +9,11 @@ to programming or Python.
 """
 
 
-import collections
 import functools
 import inspect
+import sys
 import textwrap
-import traceback
+import typing
 
 
 # Setting to true will revert to normal Python exception handling,
@@ -21,6 +21,33 @@ import traceback
 DEBUG = False
 
 
+class CallFrame(typing.NamedTuple):
+    """Location in a user script where an API was called.
+
+    Provides the same attributes as traceback.FrameSummary used by this
+    module, but is created directly from a frame object, avoiding the
+    source file access performed when extracting a stack summary.
+    """
+
+    filename: str
+    lineno: int
+    name: str
+
+
+def get_call_frame(depth):
+    """Captures the location of a frame on the current call stack.
+
+    The depth is relative to the function calling this function, e.g.,
+    zero refers to the caller itself.
+    """
+    frame = sys._getframe(depth + 1) # pylint: disable=protected-access
+    return CallFrame(
+        frame.f_code.co_filename,
+        frame.f_lineno,
+        frame.f_code.co_name,
+    )
+
+
 def exit_on_script_error(api):
     """Decorator to exit upon catching a ScriptError.
 
@@ -28,29 +55,31 @@ def exit_on_script_error(api):
     is added to the original exception. When stacked with other decorators
     it must be outermost, i.e., listed first.
     """
+    # For API classes, the call frame where the object was created is
+    # stored in the instance. This attribute is needed by the
+    # @external_call decorator. Whether the API is a class is determined
+    # here once instead of for every call.
+    store_call_frame = inspect.isclass(api)
+
     @functools.wraps(api)
     def wrapper(*args, **kwargs):
 
-        # Capture the location where this API was called from the
-        # user script. The normal exception traceback is not used
+        # The location where this API was called from the user script
+        # is captured from the frame calling this wrapper, and only when
+        # it is actually needed. The normal exception traceback is not used
         # because it is difficult to determine which frame represents
         # the departure from the user script, whereas it is always
-        # in the same location in a traceback relative to this wrapper
+        # in the same location on the stack relative to this wrapper
         # function.
-        call_frame = traceback.extract_stack(limit=2)[0]
-
         try:
             result = api(*args, **kwargs)
 
         except UserScriptError as e:
 
-            try:
-                e.call_frame
-
             # Use the frame from this call if the exception does not
             # provide one.
-            except AttributeError:
-                e.call_frame = call_frame
+            if e.call_frame is None:
+                e.call_frame = get_call_frame(1)
                 e.api = api
 
             if DEBUG:
@@ -60,11 +89,8 @@ def exit_on_script_error(api):
             # print the stack trace.
             raise SystemExit(e) from e
 
-        # For API classes, store the call frame where the object was created
-        # in the instance. This attribute is needed by the
-        # @external_call decorator.
-        if inspect.isclass(api):
-            result._call_frame = call_frame
+        if store_call_frame:
+            result._call_frame = get_call_frame(1)
 
         return result
 
@@ -101,6 +127,12 @@ class UserScriptError(Exception):
     the error, which can be added as the exception propagates up.
     """
 
+    # Location in the user script and API where the error originated;
+    # assigned as the exception propagates through the decorators in this
+    # module.
+    call_frame = None
+    api = None
+
     # String separating keys and values in the formatted presentation string.
     FIELD_SEP = ": "
 
@@ -111,8 +143,13 @@ class UserScriptError(Exception):
         "Remedy",
     ])
 
+    # Wrapper used to format multiline fields, reused for all fields
+    # instead of being recreated by textwrap.fill() for each one. The
+    # indentation attributes are assigned for each field when formatted.
+    WRAPPER = textwrap.TextWrapper()
+
     def __init__(self, desc, remedy=None,):
-        self.fields = collections.OrderedDict()
+        self.fields = {}
         if remedy:
             self.fields["Remedy"] = remedy
         self.fields["Description"] = desc
@@ -124,7 +161,7 @@ class UserScriptError(Exception):
     def __str__(self):
         """Formats all fields into a simple key: value table."""
 
-        has_api = hasattr(self, "api")
+        has_api = self.api is not None
 
         if has_api:
             self.fields["In Call To"] = f"atform.{self.api.__name__}"
@@ -133,7 +170,7 @@ class UserScriptError(Exception):
         self.fields["File"] = self.call_frame.filename
 
         # Compute the indentation required to right-align all field names.
-        indent = max(len(s) for s in self.fields.keys())
+        indent = max(map(len, self.fields))
 
         lines = ["The following error was encountered:"]
         lines.append("")
@@ -141,22 +178,25 @@ class UserScriptError(Exception):
         # Fields are added from most specific to most general as the
         # exception propagates up from its origin, so they are listed here
         # in reverse order to render top to bottom in increasing specificity.
-        for field in reversed(self.fields):
-            value = str(self.fields[field])
+        for field, value in reversed(list(self.fields.items())):
+            value = str(value)
 
             # Wrap multiline fields.
             if field in self.MULTILINE_FIELDS:
                 collapsed = " ".join(value.split()) # Collapse whitespace.
-                line = textwrap.fill(
-                    self.FIELD_SEP.join((field, collapsed)),
 
-                    # Indent first line so the field name is right-aligned
-                    # with other field names.
-                    initial_indent=" " * (indent - len(field)),
+                # Indent first line so the field name is right-aligned
+                # with other field names.
+                self.WRAPPER.initial_indent = " " * (indent - len(field))
+
+                # Remaining lines are indented to align with other
+                # field values.
+                self.WRAPPER.subsequent_indent = " " * (
+                    indent + len(self.FIELD_SEP)
+                )
 
-                    # Remaining lines are indented to align with other
-                    # field values.
-                    subsequent_indent=" " * (indent + len(self.FIELD_SEP)),
+                line = self.WRAPPER.fill(
+                    self.FIELD_SEP.join((field, collapsed))
                 )
 
             # Single line field.
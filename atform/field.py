@@ -19,11 +19,16 @@ Field = collections.namedtuple(
 )
 
 
+# Result of validating an omitted name list, shared because it is empty
+# and immutable.
+NO_NAMES = frozenset()
+
+
 def validate_name_list(title, lst):
     """Verifies a list to confirm it contains only valid field names."""
     if lst is None:
-        lst = []
-    elif not isinstance(lst, list):
+        return NO_NAMES
+    if not isinstance(lst, list):
         raise error.UserScriptError(
             f"Invalid {title} data type: {type(lst).__name__}",
             f"{title} must be a list of field names.",
@@ -31,13 +36,11 @@ def validate_name_list(title, lst):
     names = set()
     for raw in lst:
         name = misc.nonempty_string("field name", raw)
-        try:
-            state.fields[name]
-        except KeyError as e:
+        if name not in state.fields:
             raise error.UserScriptError(
                 f"Undefined name in {title} list: {name}",
                 "Use a name defined with atform.add_field().",
-            ) from e
+            )
         names.add(name)
     return names
 
@@ -48,6 +51,13 @@ def get_active_names(include, exclude, active):
     exclude = validate_name_list("exclude fields", exclude)
     if active is not None:
         return validate_name_list("active fields", active)
+
+    # The current active fields are returned without copying if there are
+    # no changes, which is typical for most tests. Callers must therefore
+    # not modify the result.
+    if not (include or exclude):
+        return state.active_fields
+
     return state.active_fields.union(include).difference(exclude)
 
 
@@ -56,12 +66,11 @@ def get_active_fields(include, exclude, active):
     Generates the list of field tuples to be applied to the next test
     after applying filters.
     """
-    names = list(get_active_names(include, exclude, active))
-
-    # Sort according to order defined by add_field().
-    names.sort(key=lambda n: list(state.fields.keys()).index(n))
+    names = get_active_names(include, exclude, active)
 
-    return [state.fields[name] for name in names]
+    # Fields are stored in the order defined by add_field(), so filtering
+    # them in that order yields a sorted result.
+    return [f for name, f in state.fields.items() if name in names]
 
 
 ################################################################################
@@ -99,15 +108,12 @@ def add_field(title, length, name, active=True):
     )
 
     name = misc.nonempty_string("field name", name)
-    try:
-        state.fields[name]
-    except KeyError:
-        state.fields[name] = field
-    else:
+    if name in state.fields:
         raise error.UserScriptError(
             f"Duplicate field name: {name}",
             "Select a unique field name."
         )
+    state.fields[name] = field
 
     if not isinstance(active, bool):
         raise error.UserScriptError(
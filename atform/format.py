@@ -1,7 +1,7 @@
 """Text formatting API available to user scripts."""
 
 
-from xml.etree import ElementTree
+from xml.sax import saxutils
 
 from . import error
 
@@ -34,6 +34,29 @@ def allowed_format(i):
     return ", ".join(quoted[:-1]) + f", or {quoted[-1]}"
 
 
+# Valid typeface and font parameters of format_text(), along with
+# their descriptions for error messages, derived once from FONTS.
+TYPEFACES = frozenset(k[0] for k in FONTS)
+FONT_STYLES = frozenset(k[1] for k in FONTS)
+ALLOWED_TYPEFACES = allowed_format(0)
+ALLOWED_FONT_STYLES = allowed_format(1)
+
+
+def font_attributes(values):
+    """Builds the intra-paragraph font element attributes for a FONTS value."""
+    attrs = f' face="{values[0]}"'
+    try:
+        attrs += f' size="{values[1]}"'
+    except IndexError:
+        pass
+    return attrs
+
+
+# Font element attribute strings for each FONTS key, generated once because
+# the values are constant.
+FONT_ATTRIBUTES = {k: font_attributes(v) for k, v in FONTS.items()}
+
+
 ################################################################################
 # Public API
 #
@@ -80,8 +103,10 @@ def bullet_list(*items):
 
         stripped.append(item)
 
-    bullet_items = [f"<bullet indent='{indent}'>{symbol}</bullet>{i}"
-                    for i in stripped]
+    # Markup preceding each item, which is identical for all items.
+    prefix = f"<bullet indent='{indent}'>{symbol}</bullet>"
+
+    bullet_items = [prefix + i for i in stripped]
 
     # Add empty leading and trailing strings so items get surrounded by double
     # newlines by the final join(), ensuring the list is separated from
@@ -117,28 +142,22 @@ def format_text(text, typeface="normal", font="normal"):
             "Text to be formatted must be a string.",
         )
 
-    typefaces = {k[0] for k in FONTS}
-    if not typeface in typefaces:
+    if not typeface in TYPEFACES:
         raise error.UserScriptError(
             f"Invalid text format typeface: {typeface}",
-            f"Select {allowed_format(0)} as a typeface.",
+            f"Select {ALLOWED_TYPEFACES} as a typeface.",
         )
 
-    fonts = {k[1] for k in FONTS}
-    if not font in fonts:
+    if not font in FONT_STYLES:
         raise error.UserScriptError(
             f"Invalid text format font: {font}",
-            f"Select {allowed_format(1)} as a font.",
+            f"Select {ALLOWED_FONT_STYLES} as a font.",
         )
 
-    font_values = FONTS[(typeface, font)]
-    attrib = {"face":font_values[0]}
-    try:
-        attrib["size"] = str(font_values[1])
-    except IndexError:
-        pass
+    attrs = FONT_ATTRIBUTES[(typeface, font)]
 
-    # Enclose the string in a intra-paragraph XML markup element.
-    e = ElementTree.Element("font", attrib=attrib)
-    e.text = text
-    return ElementTree.tostring(e, encoding="unicode")
+    # Enclose the string in a intra-paragraph XML markup element, using
+    # the same serialization as ElementTree.tostring().
+    if not text:
+        return f"<font{attrs} />"
+    return f"<font{attrs}>{saxutils.escape(text)}</font>"
@@ -21,16 +21,25 @@ def get_id():
     state.current_id[-1] = state.current_id[-1] + 1
 
     # Initialize section levels that have been reset(0) to one.
-    for i, x in enumerate(state.current_id):
-        if x == 0:
-            state.current_id[i] = 1
+    state.current_id[:] = [x or 1 for x in state.current_id]
 
     return tuple(state.current_id)
 
 
 def to_string(id_):
     """Generates a presentation string for a given ID tuple."""
-    return ".".join([str(x) for x in id_])
+    # Typical ID depths are formatted directly, avoiding the intermediate
+    # sequence of strings needed by join().
+    depth = len(id_)
+    if depth == 1:
+        return str(id_[0])
+    if depth == 2:
+        return f"{id_[0]}.{id_[1]}"
+    if depth == 3:
+        return f"{id_[0]}.{id_[1]}.{id_[2]}"
+    if depth == 4:
+        return f"{id_[0]}.{id_[1]}.{id_[2]}.{id_[3]}"
+    return ".".join(map(str, id_))
 
 
 def validate_section_title(title):
@@ -63,12 +63,21 @@ def add_logo(path):
             "Path to the logo image file must be a string.",
         )
 
+    # Read the file once; the same data is both validated here and
+    # embedded in the output documents.
+    if isinstance(path, str):
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError as e:
+            raise error.UserScriptError(
+                f"Logo image file not found: {path}",
+            ) from e
+    else:
+        data = path.getvalue()
+
     try:
-        image = PIL.Image.open(path, formats=["JPEG"])
-    except FileNotFoundError as e:
-        raise error.UserScriptError(
-            f"Logo image file not found: {path}",
-        ) from e
+        image = PIL.Image.open(io.BytesIO(data), formats=["JPEG"])
     except PIL.UnidentifiedImageError as e:
         raise error.UserScriptError(
             f"Unsupported logo image format: {path}",
@@ -102,17 +111,10 @@ def add_logo(path):
             """,
         )
 
-    # Dump the JPEG data to an in-memory buffer and convert to a Reportlab
-    # Image object.
-    buf = io.BytesIO()
-    image.save(
-        buf,
-        format="JPEG",
-        quality="keep",
-        dpi=dpi,
-    )
+    # Convert the original JPEG data to a Reportlab Image object; the
+    # image is embedded as-is, so it does not need to be re-encoded.
     state.logo = Image(
-        buf,
+        io.BytesIO(data),
         width=size.width*inch,
         height=size.height*inch,
     )
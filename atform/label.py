@@ -18,6 +18,13 @@ from . import state
 valid_label_pattern = re.compile(r"(?ai:[_a-z][_a-z0-9]*)$")
 
 
+# Regular expression pattern to match placeholders, which is the compiled
+# pattern from template strings. It is used directly, instead of creating
+# a Template object for every string, so a single substitution function
+# can serve all strings.
+placeholder_pattern = string.Template.pattern
+
+
 def add(label, id_):
     """Assigns an identifier to a label.
 
@@ -52,16 +59,33 @@ def add(label, id_):
     state.labels[label] = id_
 
 
+def replace_placeholder(match):
+    """Substitution function for a single placeholder match.
+
+    Mirrors string.Template.substitute(), raising KeyError for undefined
+    labels and ValueError for invalid placeholders.
+    """
+    lbl = match.group("named") or match.group("braced")
+    if lbl is not None:
+        return state.labels[lbl]
+    if match.group("escaped") is not None:
+        return string.Template.delimiter
+    raise ValueError("Invalid placeholder.")
+
+
 def resolve(orig):
     """Replaces label placeholders with the target IDs.
 
     The public API already validates the original string to ensure it is
     in fact a string, so only substitution needs to be checked.
     """
-    tpl = string.Template(orig)
+    # Skip the substitution entirely for strings that cannot contain any
+    # placeholders, which is the majority of content.
+    if string.Template.delimiter not in orig:
+        return orig
 
     try:
-        return tpl.substitute(state.labels)
+        return placeholder_pattern.sub(replace_placeholder, orig)
 
     except KeyError as e:
         raise error.UserScriptError(
@@ -75,3 +99,19 @@ def resolve(orig):
             "letter or underscore, followed by zero or more letters, "
             "numbers, or underscore.",
         ) from e
+
+
+def resolve_many(strings, context):
+    """Replaces label placeholders in a sequence of strings.
+
+    Any UserScriptError is annotated with the one-based position of the
+    offending string under the given context field name.
+    """
+    resolved = []
+    for i, orig in enumerate(strings, start=1):
+        try:
+            resolved.append(resolve(orig))
+        except error.UserScriptError as e:
+            e.add_field(context, i)
+            raise
+    return resolved
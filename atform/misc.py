@@ -2,11 +2,16 @@
 
 
 import functools
+import sys
 
 from . import error
 from . import state
 
 
+# Validated strings shorter than this length are interned.
+INTERN_MAX_LEN = 256
+
+
 def setup_only(func):
     """
     Decorator for public API functions that can only be called during setup,
@@ -42,7 +47,18 @@ def nonempty_string(name, s):
             f"{name} cannot be empty.",
             f"Add content to the {name} string, or remove it altogether."
         )
-    return stripped
+    return intern_short(stripped)
+
+
+def intern_short(s):
+    """Interns a string if it is shorter than INTERN_MAX_LEN."""
+    # Short strings, e.g., titles, are frequently duplicated across tests;
+    # interning them allows duplicates to share a single object, which
+    # also lets pickle send each one only once when transferring tests
+    # to PDF build processes.
+    if len(s) < INTERN_MAX_LEN:
+        return sys.intern(s)
+    return s
 
 
 def validate_field_length(length):
@@ -108,6 +124,12 @@ def set_project_info(project=None, system=None):
         system (str, optional): Name or description of the system being tested.
     """
     params = locals()
+
+    # Assemble an entirely new dictionary instead of updating the existing
+    # one in place because Test instances share a reference to the
+    # dictionary that was current when they were created.
+    project_info = state.project_info.copy()
     for arg in params:
         if params[arg] is not None:
-            state.project_info[arg] = nonempty_string(arg, params[arg])
+            project_info[arg] = nonempty_string(arg, params[arg])
+    state.project_info = project_info
@@ -74,7 +74,6 @@ class TestDocument:
     def _get_doc(self, path):
         """Creates the document template."""
         pdfname = self.full_name + ".pdf"
-        os.makedirs(path, exist_ok=True)
         filename = os.path.join(path, pdfname)
         return SimpleDocTemplate(
             filename,
@@ -3,8 +3,8 @@ This module implements validation of the procedure list provided to Test()
 instances.
 """
 
-import collections
 import dataclasses
+import typing
 
 from . import (
     error,
@@ -13,13 +13,24 @@ from . import (
 )
 
 
-# Container to hold normalized procedure step field definitions. This is
-# not part of the public API as fields are defined via normal tuples, which
-# are then validated to create instances of this named tuple.
-Field = collections.namedtuple(
-    "Field",
-    ["title", "length", "suffix"],
-)
+# Keys allowed in a procedure step dictionary.
+STEP_KEYS = frozenset([
+    "fields",
+    "label",
+    "text",
+])
+
+
+class Field(typing.NamedTuple):
+    """Storage for a single procedure step data entry field.
+
+    This is not part of the public API as fields are defined via normal
+    tuples, which are then validated to create instances of this named tuple.
+    """
+
+    title: str
+    length: int
+    suffix: str
 
 
 @dataclasses.dataclass(
@@ -37,10 +48,6 @@ class Step:
     text: str
     fields: list[Field]
 
-    def resolve_labels(self):
-        """Replaces label placeholders with their target IDs."""
-        self.text = label.resolve(self.text)
-
 
 def validate(lst):
     """Validates a user-provided list containing procedure steps."""
@@ -90,22 +97,20 @@ def normalize_type(raw):
 
 def validate_text(data):
     """Validates the text key."""
-    try:
-        text = data.pop("text")
-    except KeyError as e:
+    if "text" not in data:
         raise error.UserScriptError(
             'A procedure step dictionary must have a "text" key.',
             """
             Add a "text" key with a string value containing instructions
             for the step.
             """,
-        ) from e
-    return misc.nonempty_string("Procedure step text", text)
+        )
+    return misc.nonempty_string("Procedure step text", data["text"])
 
 
 def validate_fields(data):
     """Validates the fields key."""
-    tpls = data.pop("fields", [])
+    tpls = data.get("fields", [])
     if not isinstance(tpls, list):
         raise error.UserScriptError(
             f"Invalid procedure step fields data type: {type(tpls).__name__}",
@@ -132,31 +137,16 @@ def create_field(tpl):
             "Each item in the list of fields for a procedure step must be a tuple.",
         )
 
-    # Validate the required items: title and length.
-    try:
-        raw_title = tpl[0]
-        raw_length = tpl[1]
-    except IndexError as e:
+    num_items = len(tpl)
+    if num_items < 2:
         raise error.UserScriptError(
             "Procedure step field tuple is too short.",
             """
             A tuple defining a data entry field for a procedure step must have at
             least two members: title and length.
             """,
-        ) from e
-
-    title = misc.nonempty_string("Procedure step field title", raw_title)
-    length = misc.validate_field_length(raw_length)
-
-    # Validate suffix, providing a default value if omitted.
-    try:
-        raw = tpl[2]
-    except IndexError:
-        suffix = ""
-    else:
-        suffix = misc.nonempty_string("Procedure step field suffix", raw)
-
-    if len(tpl) > len(Field._fields):
+        )
+    if num_items > len(Field._fields):
         raise error.UserScriptError(
             "Procedure step field tuple is too long.",
             """
@@ -165,30 +155,37 @@ def create_field(tpl):
             """,
         )
 
+    raw_title, raw_length, *raw_suffix = tpl
+
+    # Validate the required items: title and length.
+    title = misc.nonempty_string("Procedure step field title", raw_title)
+    length = misc.validate_field_length(raw_length)
+
+    # Validate suffix, providing a default value if omitted.
+    if raw_suffix:
+        suffix = misc.nonempty_string("Procedure step field suffix", raw_suffix[0])
+    else:
+        suffix = ""
+
     return Field(title, length, suffix)
 
 
 def validate_label(data, num):
     """Creates a label referencing the step."""
-    try:
-        lbl = data.pop("label")
-
     # Label is optional; do nothing if omitted.
-    except KeyError:
-        pass
-
-    else:
-        label.add(lbl, str(num))
+    if "label" in data:
+        label.add(data["label"], str(num))
 
 
 def check_undefined_keys(data):
     """Checks for undefined keys in a user-provided step dictionary.
 
-    Defined keys are removed from the original dictionary as they are validated, so
-    any remaining keys are assumed to be undefined.
+    The user-provided dictionary is only read, never modified, so undefined
+    keys are identified by comparison with the set of allowable keys.
     """
-    if data:
-        keys = ", ".join([str(k) for k in data.keys()])
+    undefined = [str(k) for k in data if k not in STEP_KEYS]
+    if undefined:
+        keys = ", ".join(undefined)
         raise error.UserScriptError(
             f"Undefined procedure step dictionary key(s): {keys}",
         )
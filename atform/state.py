@@ -22,8 +22,6 @@ in the local namespace, which does not get reinitialized in init(), causing
 unit test failure.
 """
 
-import collections
-
 
 def init():
     """Initializes all default values."""
@@ -45,7 +43,7 @@ def init():
 
     # All defined fields, keyed by name, and ordered as added by add_field().
     global fields
-    fields = collections.OrderedDict()
+    fields = {}
 
     # Target ids keyed by label.
     global labels
@@ -68,6 +66,11 @@ def init():
     global ref_titles
     ref_titles = {}
 
+    # Relative output folder paths, keyed by section ID tuple; populated
+    # as needed when output is generated.
+    global section_paths
+    section_paths = {}
+
     # Section titles, keyed by ID tuple.
     global section_titles
     section_titles = {}
@@ -76,5 +79,14 @@ def init():
     global signatures
     signatures = []
 
+    # Document version acquired from version control, which is only queried
+    # once, when output is first generated.
+    global version
+    version = None
+
+    # Flag indicating if the version has been acquired from version control.
+    global version_queried
+    version_queried = False
+
 
 init()
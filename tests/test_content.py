@@ -2,9 +2,11 @@
 
 
 from tests import utils
+import pickle
 import string
 import atform
 import unittest
+from unittest.mock import patch
 
 
 class Title(unittest.TestCase):
@@ -388,6 +390,15 @@ class StringList(object):
         with self.assertRaises(SystemExit):
             self.call([string.whitespace])
 
+    def test_invalid_after_valid(self):
+        """Confirm exception identifies an invalid item following valid items."""
+        # The underlying class is used so the UserScriptError is raised
+        # directly instead of exiting.
+        validate = atform.content.Test.__wrapped__._validate_string_list
+        with self.assertRaises(atform.error.UserScriptError) as cm:
+            validate(self.name, ["Foo", "Bar", "", 42])
+        self.assertEqual(3, cm.exception.fields[f"{self.name} item #"])
+
     def test_strip(self):
         """Confirm surrounding whitespace is removed from list items."""
         t = self.call([string.whitespace + "Foo" + string.whitespace])
@@ -402,11 +413,13 @@ class StringList(object):
 class Equipment(StringList, unittest.TestCase):
     """Unit tests for test equipment."""
     parameter_name = "equipment"
+    name = "Equipment"
 
 
 class Preconditions(StringList, unittest.TestCase):
     """Unit tests for test preconditions."""
     parameter_name = "preconditions"
+    name = "Preconditions"
 
 
 class ProcedureList(unittest.TestCase):
@@ -471,6 +484,13 @@ class ProcedureStepDict(ProcedureStepBase, unittest.TestCase):
         with self.assertRaises(SystemExit):
             self.make_step({"text":"spam", "foo":"bar"})
 
+    def test_not_modified(self):
+        """Confirm the original dictionary is not modified."""
+        step = {"text":"spam", "fields":[("foo", 1)], "label":"bar"}
+        orig = step.copy()
+        self.make_step(step)
+        self.assertEqual(orig, step)
+
 
 class ProcedureStepDictText(ProcedureStepBase, unittest.TestCase):
     """Unit tests for procedure step dict text key."""
@@ -621,6 +641,34 @@ class TestProjectInfo(unittest.TestCase):
         self.assertEqual({"project":"spam", "system":"eggs"}, t2.project_info)
 
 
+class Pickle(unittest.TestCase):
+    """Unit tests for pickling Test instances."""
+
+    def setUp(self):
+        utils.reset()
+
+    def test_round_trip(self):
+        """Confirm a pickled test is restored with the original content."""
+        atform.add_field("Field", 10, "f")
+        t = atform.Test(
+            "title",
+            objective="objective",
+            equipment=["equip"],
+            procedure=["step", {"text": "step", "fields": [("f", 1, "s")]}],
+        )
+        restored = pickle.loads(pickle.dumps(t))
+        self.assertIsInstance(restored, type(t))
+        self.assertEqual(t.id, restored.id)
+        self.assertEqual(t.title, restored.title)
+        self.assertEqual(t.objective, restored.objective)
+        self.assertEqual(t.fields, restored.fields)
+        self.assertEqual(t.equipment, restored.equipment)
+        self.assertEqual(
+            [(s.text, s.fields) for s in t.procedure],
+            [(s.text, s.fields) for s in restored.procedure],
+        )
+
+
 class Generate(unittest.TestCase):
     """Unit tests for the generate() function."""
 
@@ -653,3 +701,27 @@ class GenerateFolderDepth(unittest.TestCase):
             with self.subTest(i=i):
                 with self.assertRaises(SystemExit):
                     atform.generate(folder_depth=i)
+
+
+class GetVersion(unittest.TestCase):
+    """Unit tests for the get_version() function."""
+
+    def setUp(self):
+        utils.reset()
+
+    @patch("atform.vcs.Git")
+    def test_single_query(self, mock):
+        """Confirm version control is only queried once."""
+        mock.return_value.clean = True
+        mock.return_value.version = "spam"
+        for _ in range(2):
+            self.assertEqual("spam", atform.content.get_version())
+        mock.assert_called_once()
+
+    @patch("atform.vcs.Git")
+    def test_no_version_control(self, mock):
+        """Confirm the lack of version control is also retained."""
+        mock.side_effect = atform.vcs.NoVersionControlError
+        for _ in range(2):
+            self.assertIsNone(atform.content.get_version())
+        mock.assert_called_once()
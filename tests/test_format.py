@@ -28,6 +28,11 @@ class FormatText(unittest.TestCase):
         root = ElementTree.fromstring(atform.format_text("foo"))
         self.assertEqual("foo", root.text)
 
+    def test_escape(self):
+        """Confirm XML special characters in the text are escaped."""
+        root = ElementTree.fromstring(atform.format_text("<a & b>"))
+        self.assertEqual("<a & b>", root.text)
+
 
 class FormatTypeface(unittest.TestCase):
     """Unit tests for the format_text() typeface argument."""
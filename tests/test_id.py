@@ -32,6 +32,20 @@ class GetId(unittest.TestCase):
         self.assertEqual((2, 1, 1), atform.id.get_id())
 
 
+class ToString(unittest.TestCase):
+    """Unit tests for the to_string() function."""
+
+    def test_depths(self):
+        """Confirm IDs of every depth are delimited by periods."""
+        for depth in range(1, 7):
+            tid = tuple(range(1, depth + 1))
+            with self.subTest(depth=depth):
+                self.assertEqual(
+                    ".".join(str(x) for x in tid),
+                    atform.id.to_string(tid),
+                )
+
+
 class Section(unittest.TestCase):
     """Unit tests for the section() function."""
 
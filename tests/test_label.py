@@ -111,3 +111,33 @@ class Resolve(unittest.TestCase):
         label.add("spam", "foo")
         label.add("eggs", "bar")
         self.assertEqual("foo bar", label.resolve("$spam $eggs"))
+
+    def test_escape(self):
+        """Confirm an escaped delimiter is replaced with a single delimiter."""
+        self.assertEqual("$foo", label.resolve("$$foo"))
+
+    def test_braced(self):
+        """Confirm braced labels are replaced with their IDs."""
+        label.add("spam", "foo")
+        self.assertEqual("foobar", label.resolve("${spam}bar"))
+
+
+class ResolveMany(unittest.TestCase):
+    """Unit tests for the resolve_many() function."""
+
+    def setUp(self):
+        utils.reset()
+
+    def test_replacement(self):
+        """Confirm labels are replaced in every string."""
+        label.add("spam", "foo")
+        self.assertEqual(
+            ["foo", "bar", "x foo"],
+            label.resolve_many(["$spam", "bar", "x $spam"], "Item"),
+        )
+
+    def test_error_context(self):
+        """Confirm an exception identifies the offending string."""
+        with self.assertRaises(UserScriptError) as cm:
+            label.resolve_many(["foo", "$bar"], "Item")
+        self.assertEqual(2, cm.exception.fields["Item"])
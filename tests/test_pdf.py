@@ -4,8 +4,12 @@
 from tests import utils
 import atform.pdf
 import os
+import subprocess
+import sys
 import tempfile
+import textwrap
 import unittest
+from unittest.mock import patch
 
 
 class BuildPath(unittest.TestCase):
@@ -78,3 +82,109 @@ class OutputSectionPathDepth(unittest.TestCase):
         path.extend(["1"] * depth)
         path.append("1.1.1.1 Foo.pdf")
         self.assertTrue(os.path.exists(os.path.join(*path)))
+
+
+class Debug(unittest.TestCase):
+    """Tests for generating output in debug mode."""
+
+    def setUp(self):
+        utils.reset()
+
+    @patch.object(atform.error, "DEBUG", new=True)
+    @patch.object(atform.content, "build_parallel")
+    def test_output(self, build_parallel):
+        """Verify PDFs are built within the calling process."""
+        atform.Test("Foo")
+        atform.Test("Bar")
+        with tempfile.TemporaryDirectory() as root:
+            atform.generate(path=root)
+            build_parallel.assert_not_called()
+            self.assertEqual(
+                ["1 Foo.pdf", "2 Bar.pdf"],
+                sorted(os.listdir(root)),
+            )
+
+
+class WorkerCount(unittest.TestCase):
+    """Tests for the number of CPUs available to build PDFs."""
+
+    def setUp(self):
+        utils.reset()
+        atform.Test("Foo")
+        atform.Test("Bar")
+
+    @patch("os.cpu_count", return_value=1)
+    @patch.object(atform.content, "build_parallel")
+    def test_single_cpu(self, build_parallel, _cpu_count):
+        """Verify PDFs are built within the calling process with one CPU."""
+        with tempfile.TemporaryDirectory() as root:
+            atform.generate(path=root)
+            build_parallel.assert_not_called()
+            self.assertEqual(
+                ["1 Foo.pdf", "2 Bar.pdf"],
+                sorted(os.listdir(root)),
+            )
+
+    @unittest.skipIf(atform.content.get_build_context() is None,
+                     "Worker processes cannot be forked.")
+    @patch("os.cpu_count", return_value=2)
+    def test_multiple_cpus(self, _cpu_count):
+        """Verify PDFs are built by worker processes with multiple CPUs."""
+        with tempfile.TemporaryDirectory() as root:
+            with patch.object(
+                    atform.content,
+                    "build_parallel",
+                    wraps=atform.content.build_parallel,
+            ) as build_parallel:
+                atform.generate(path=root)
+            build_parallel.assert_called_once()
+            self.assertEqual(
+                ["1 Foo.pdf", "2 Bar.pdf"],
+                sorted(os.listdir(root)),
+            )
+
+
+class SpawnStartMethod(unittest.TestCase):
+    """Tests for generating output when processes are started by spawning."""
+
+    # Script run in a separate interpreter; it prints a line at the
+    # beginning to count the number of times it is executed.
+    SCRIPT = textwrap.dedent("""
+        import multiprocessing
+        multiprocessing.set_start_method("spawn", force=True)
+        print("script executed")
+        import atform
+        for title in ["Foo", "Bar", "Spam", "Eggs"]:
+            atform.Test(title)
+        atform.generate()
+        """)
+
+    def test_single_execution(self):
+        """Verify the script is executed once and all PDFs are built."""
+        # The repository root, so atform can be imported by the script.
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ)
+        env["PYTHONPATH"] = root
+
+        with tempfile.TemporaryDirectory() as cwd:
+            # The script must be a file, rather than passed with -c, because
+            # spawned processes only execute a main script run from a file.
+            with open(os.path.join(cwd, "script.py"), "w") as f:
+                f.write(self.SCRIPT)
+
+            result = subprocess.run(
+                [sys.executable, "script.py"],
+                env=env,
+                cwd=cwd,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            result.check_returncode()
+            self.assertEqual(1, result.stdout.count("script executed"))
+            self.assertEqual(
+                ["1 Foo.pdf", "2 Bar.pdf", "3 Spam.pdf", "4 Eggs.pdf"],
+                sorted(os.listdir(os.path.join(cwd, "pdf")),
+                       key=lambda f: int(f.split()[0])),
+            )
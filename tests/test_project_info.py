@@ -48,3 +48,17 @@ class System(ParameterBase, unittest.TestCase):
     """Unit tests for setting the system name."""
 
     parameter = "system"
+
+
+class ExistingTests(unittest.TestCase):
+    """Unit tests for project information assigned to existing tests."""
+
+    def setUp(self):
+        utils.reset()
+
+    def test_later_change(self):
+        """Confirm a later change does not affect previously created tests."""
+        atform.set_project_info(project="foo")
+        t = atform.Test("title")
+        atform.set_project_info(project="bar", system="spam")
+        self.assertEqual({"project": "foo"}, t.project_info)